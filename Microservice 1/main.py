@@ -1,6 +1,7 @@
 import asyncio
+import gzip
 import json
-from flask import Flask, jsonify, Response, request
+from flask import Flask, Response, request
 from flask_cors import CORS
 from prometheus_flask_exporter import PrometheusMetrics
 from prometheus_client import Counter, Gauge, generate_latest, REGISTRY
@@ -10,6 +11,17 @@ import http.client
 import psycopg2
 from sqlalchemy.testing import db
 
+# Optional faster JSON encoder and brotli compression
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 app = Flask(__name__)
 CORS(app)
 metrics = PrometheusMetrics(app)
@@ -29,6 +41,46 @@ requests_counter = Counter('service1_requests_total', 'Total number of requests
 joke_counter = Counter('jokes_delivered_total', 'Total number of jokes delivered')
 joke_success_gauge = Gauge('joke_delivery_success', 'Joke delivery success (1 for success, 0 for failure)')
 
+# Response compression settings
+COMPRESS_MIN_SIZE = 500  # Bodies smaller than this (in bytes) are sent as-is
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+def json_response(payload, status=200):
+    # Serialize compactly, using orjson when available
+    body = None
+    if orjson is not None:
+        try:
+            body = orjson.dumps(payload)
+        except TypeError:
+            # orjson rejects some values (e.g. non-string keys); fall back to json
+            body = None
+    if body is None:
+        body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return Response(body, status=status, mimetype='application/json')
+
+@app.after_request
+def compress_response(response):
+    # Only compress complete, unencoded bodies that are worth compressing
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    accept_encodings = request.accept_encodings
+    if brotli is not None and accept_encodings['br'] > 0:
+        response.set_data(brotli.compress(body, quality=BROTLI_QUALITY))
+        response.headers['Content-Encoding'] = 'br'
+    elif accept_encodings['gzip'] > 0:
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 def create_tables():
     # Connect to the database
     conn = psycopg2.connect(**db_params)
@@ -111,7 +163,7 @@ with app.app_context():
 # Health Endpoint
 @app.route('/health')
 def health():
-    return jsonify({'status': 'Service 1 is healthy'})
+    return json_response({'status': 'Service 1 is healthy'})
 
 # Business Logic Endpoints
 
@@ -141,7 +193,7 @@ def fetch_random_joke():
         increment_counters()
 
         add_joke_to_db ( category, joke_from_api )
-        return joke_from_api
+        return json_response(joke_from_api)
 
     # API returned an error, or an empty response, use the Jokes class as a fallback
     return fetch_joke_using_library(category)
@@ -160,16 +212,18 @@ def get_joke_from_api(category):
     res = conn.getresponse()
     data = res.read()
 
-    joke_from_api = data.decode("utf-8")
+    # Parse the JSON response once so it can be reused by the caller
+    try:
+        joke_from_api = json.loads(data)
+    except ValueError:
+        return None
     return joke_from_api if joke_from_api else None
 
 def is_api_error_response(api_response):
-    # Check if the API response indicates an error
-    try:
-        response_json = json.loads(api_response)
-        return response_json.get("error", False)
-    except json.JSONDecodeError:
-        return False
+    # Check if the parsed API response indicates an error
+    if not isinstance(api_response, dict):
+        return True
+    return api_response.get("error", False)
 
 def fetch_joke_using_library(category):
     # Initialize the Jokes class
@@ -190,7 +244,7 @@ def fetch_joke_using_library(category):
     joke_success_gauge.set(1)  # Assuming successful delivery, modify as per your logic
 
     # Format the response to return only the setup and delivery
-    return joke
+    return json_response(joke)
 
 def increment_counters():
     # Increment the requests counter
@@ -228,7 +282,7 @@ def fetch_news():
         conn.request("POST", "/headline", payload, headers)
 
         res = conn.getresponse()
-        data = res.read().decode("utf-8")
+        data = res.read()
 
         # Parse the JSON response
         response_json = json.loads(data)
@@ -250,10 +304,10 @@ def fetch_news():
             formatted_headlines.append(formatted_headline)
 
         # Return the formatted headlines as JSON
-        return jsonify({'headlines': formatted_headlines})
+        return json_response({'headlines': formatted_headlines})
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 # New Endpoint to Fetch News from RapidAPI on a Specific Category
 @app.route('/fetch-news-category', methods=['GET'])
@@ -288,7 +342,7 @@ def fetch_news_by_category():
         conn.request("POST", "/", payload, headers)
 
         res = conn.getresponse()
-        data = res.read().decode("utf-8")
+        data = res.read()
 
         # Parse the JSON response
         response_json = json.loads(data)
@@ -311,10 +365,10 @@ def fetch_news_by_category():
             formatted_headlines.append(formatted_headline)
 
         # Return the formatted headlines as JSON
-        return jsonify({'headlines': formatted_headlines})
+        return json_response({'headlines': formatted_headlines})
 
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return json_response({'error': str(e)}, 500)
 
 
 # New Endpoint to Fetch Joke Categories
@@ -337,13 +391,13 @@ def get_joke_categories():
     conn.request("GET", "/categories?format=json", headers=headers)
 
     res = conn.getresponse()
-    data = res.read().decode("utf-8")
+    data = res.read()
 
     # Parse the JSON response and extract category names
     categories_response = json.loads(data)
     category_names = categories_response.get('categories', [])
 
-    return jsonify({'joke_categories': category_names})
+    return json_response({'joke_categories': category_names})
 
 # Status Endpoint
 @app.route('/status')
@@ -355,7 +409,7 @@ def status():
       200:
         description: Service status
     """
-    return jsonify({'status': 'Service 1 is up and running'})
+    return json_response({'status': 'Service 1 is up and running'})
 
 # ... Other middleware and configurations
 
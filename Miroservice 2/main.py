@@ -1,5 +1,6 @@
+import gzip
 import json
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 from flask_cors import CORS
 from prometheus_client import start_http_server, Counter
 from sendgrid import SendGridAPIClient
@@ -9,6 +10,17 @@ import http.client
 from timeout_decorator import timeout, TimeoutError
 import psycopg2
 
+# Optional faster JSON encoder and brotli compression
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 swagger = Swagger(app)  # Initialize Swagger
@@ -16,6 +28,46 @@ swagger = Swagger(app)  # Initialize Swagger
 # Prometheus Metrics
 service2_requests_total = Counter('service2_requests_total', 'Total number of requests to Service 2')
 
+# Response compression settings
+COMPRESS_MIN_SIZE = 500  # Bodies smaller than this (in bytes) are sent as-is
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+def json_response(payload, status=200):
+    # Serialize compactly, using orjson when available
+    body = None
+    if orjson is not None:
+        try:
+            body = orjson.dumps(payload)
+        except TypeError:
+            # orjson rejects some values (e.g. non-string keys); fall back to json
+            body = None
+    if body is None:
+        body = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return Response(body, status=status, mimetype='application/json')
+
+@app.after_request
+def compress_response(response):
+    # Only compress complete, unencoded bodies that are worth compressing
+    if (response.direct_passthrough or response.is_streamed
+            or response.status_code < 200 or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    accept_encodings = request.accept_encodings
+    if brotli is not None and accept_encodings['br'] > 0:
+        response.set_data(brotli.compress(body, quality=BROTLI_QUALITY))
+        response.headers['Content-Encoding'] = 'br'
+    elif accept_encodings['gzip'] > 0:
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 # Database Connection
 conn = psycopg2.connect(
     host="localhost",  # Use the correct host where your PostgreSQL is running
@@ -107,7 +159,7 @@ def send_email():
     # Check if 'type' key exists in the content_data dictionary
     content_type = content_data.get('type')
     if not content_type or content_type not in ['joke', 'news', 'webpage']:
-        return jsonify({'error': True, 'message': 'Invalid content type'})
+        return json_response({'error': True, 'message': 'Invalid content type'})
 
     # Extract content information based on the content type
     setup_text = content_data.get('setup', 'No setup provided')
@@ -115,7 +167,7 @@ def send_email():
     to_email = content_data.get('to')
 
     if not to_email:
-        return jsonify({'error': True, 'message': 'Recipient email not provided'})
+        return json_response({'error': True, 'message': 'Recipient email not provided'})
 
     # Save content data to the database
     save_content_to_database(content_type, to_email, f"{setup_text} ")
@@ -136,10 +188,10 @@ def send_email():
         sg = SendGridAPIClient(api_key="api key")
         response = sg.send(message)
         print(f'Email sent to {to_email}. Response:', response.body)
-        return jsonify({'status': 'Email sent successfully'})
+        return json_response({'status': 'Email sent successfully'})
     except Exception as e:
         # Handle any exceptions (e.g., network issues) and return an error response
-        return jsonify({'error': True, 'message': str(e)})
+        return json_response({'error': True, 'message': str(e)})
 
 
 def save_content_to_database(content_type, to_email, content):
@@ -181,7 +233,7 @@ def validate_email():
     """
     email = request.json.get('email')
     if not email:
-        return jsonify({'error': True, 'message': 'Email not provided'})
+        return json_response({'error': True, 'message': 'Email not provided'})
 
     # Validate email using the email-check API
     conn = http.client.HTTPSConnection("email-validator8.p.rapidapi.com", timeout=30)
@@ -196,7 +248,7 @@ def validate_email():
     res = conn.getresponse()
     data = res.read()
 
-    return jsonify({'result': json.loads(data.decode("utf-8"))})
+    return json_response({'result': json.loads(data)})
 
 
 # Paraphrase Text Endpoint
@@ -222,7 +274,7 @@ def paraphrase_text():
     """
     text_to_paraphrase = request.json.get('text')
     if not text_to_paraphrase:
-        return jsonify({'error': True, 'message': 'Text not provided'})
+        return json_response({'error': True, 'message': 'Text not provided'})
 
     # Paraphrase text using the paraphraser API
     conn = http.client.HTTPSConnection("rewriter-paraphraser-text-changer-multi-language.p.rapidapi.com", timeout=30)
@@ -241,7 +293,7 @@ def paraphrase_text():
     res = conn.getresponse()
     data = res.read()
 
-    return jsonify({'paraphrased_text': json.loads(data.decode("utf-8"))})
+    return json_response({'paraphrased_text': json.loads(data)})
 
 
 # Scraping Endpoint
@@ -267,7 +319,7 @@ def scrape_url():
     """
     url_to_scrape = request.json.get('url')
     if not url_to_scrape:
-        return jsonify({'error': True, 'message': 'URL not provided'})
+        return json_response({'error': True, 'message': 'URL not provided'})
 
     # Scrape data using the website scraper API
     conn = http.client.HTTPSConnection("website-article-data-extraction-and-text-mining1.p.rapidapi.com", timeout=30)
@@ -280,7 +332,7 @@ def scrape_url():
     res = conn.getresponse()
     scraped_data = res.read()
 
-    return jsonify({'scraped_data': json.loads(scraped_data.decode("utf-8"))})
+    return json_response({'scraped_data': json.loads(scraped_data)})
 
 
 # Health Endpoint
@@ -293,7 +345,7 @@ def health():
       200:
         description: Service is healthy
     """
-    return jsonify({'status': 'Service 2 is healthy'})
+    return json_response({'status': 'Service 2 is healthy'})
 
 
 # ... Other middleware and configurations
@@ -0,0 +1,141 @@
+"""
+Benchmark JSON serialization CPU time and bytes on the wire for
+representative Service 1 and Service 2 payloads.
+
+Usage:
+    python benchmarks/serialization_benchmark.py [--repeat N]
+
+orjson and brotli are optional; encoders that are not installed are skipped.
+"""
+import argparse
+import gzip
+import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Mirrors the settings in the services' main.py
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def build_payloads():
+    # Service 1 /fetch-news-category
+    headlines = {
+        'headlines': [
+            {
+                "title": f"European markets react to policy update number {i}",
+                "url": f"https://news.example.com/europe/2023/11/article-{i}",
+                "publishedAt": "Mon, 27 Nov 2023 10:%02d:00 GMT" % (i % 60),
+                "source": "Example News"
+            }
+            for i in range(100)
+        ]
+    }
+
+    # Service 1 /fetch-joke
+    joke = {
+        "error": False,
+        "category": "Programming",
+        "type": "twopart",
+        "setup": "Why do programmers prefer dark mode?",
+        "delivery": "Because light attracts bugs.",
+        "flags": {"nsfw": False, "religious": False, "political": False,
+                  "racist": False, "sexist": False, "explicit": False},
+        "id": 42,
+        "safe": True,
+        "lang": "en"
+    }
+
+    # Service 2 /scrape-url
+    paragraph = ("Microservices communicate over HTTP and exchange JSON documents. "
+                 "Large documents benefit from compact encoding and compression. ")
+    scraped = {
+        'scraped_data': {
+            "url": "https://blog.example.com/posts/microservices",
+            "title": "Building microservices with Flask",
+            "author": "Example Author",
+            "date": "2023-11-27",
+            "text": paragraph * 200,
+            "links": [f"https://blog.example.com/posts/{i}" for i in range(200)],
+            "images": [f"https://cdn.example.com/img/{i}.png" for i in range(50)]
+        }
+    }
+
+    # Service 2 /paraphrase
+    paraphrased = {
+        'paraphrased_text': {
+            "original": paragraph * 10,
+            "rewrite": paragraph.replace("benefit", "gain") * 10
+        }
+    }
+
+    return {
+        'fetch-joke': joke,
+        'fetch-news-category': headlines,
+        'scrape-url': scraped,
+        'paraphrase': paraphrased,
+    }
+
+
+def build_encoders():
+    encoders = {
+        # What Flask's jsonify produces by default
+        'jsonify-default': lambda p: json.dumps(p, sort_keys=True, separators=(',', ':')).encode('utf-8'),
+        'jsonify-pretty': lambda p: json.dumps(p, sort_keys=True, indent=2).encode('utf-8'),
+        'json-compact': lambda p: json.dumps(p, separators=(',', ':'), ensure_ascii=False).encode('utf-8'),
+    }
+    if orjson is not None:
+        encoders['orjson'] = orjson.dumps
+    return encoders
+
+
+def build_compressors():
+    compressors = {
+        'identity': lambda b: b,
+        'gzip': lambda b: gzip.compress(b, compresslevel=GZIP_LEVEL),
+    }
+    if brotli is not None:
+        compressors['br'] = lambda b: brotli.compress(b, quality=BROTLI_QUALITY)
+    return compressors
+
+
+def time_call(func, arg, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(arg)
+    elapsed = time.perf_counter() - start
+    return result, elapsed / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=1000, help='Iterations per measurement')
+    args = parser.parse_args()
+
+    payloads = build_payloads()
+    encoders = build_encoders()
+    compressors = build_compressors()
+
+    print(f"{'payload':<22}{'encoder':<18}{'encode us':>11}"
+          f"{'encoding':>10}{'compress us':>13}{'bytes':>9}")
+    for payload_name, payload in payloads.items():
+        for encoder_name, encoder in encoders.items():
+            body, encode_us = time_call(encoder, payload, args.repeat)
+            for compressor_name, compressor in compressors.items():
+                compressed, compress_us = time_call(compressor, body, args.repeat)
+                print(f"{payload_name:<22}{encoder_name:<18}{encode_us:>11.1f}"
+                      f"{compressor_name:>10}{compress_us:>13.1f}{len(compressed):>9}")
+        print()
+
+
+if __name__ == '__main__':
+    main()